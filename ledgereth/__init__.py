@@ -1,18 +1,66 @@
 """ledgereth, a library to interface with ledger-app-eth on Ledger hardware wallets."""
-from importlib.metadata import metadata
-from ledgereth.accounts import find_account, get_account_by_path, get_accounts
-from ledgereth.messages import sign_message, sign_typed_data_draft
-from ledgereth.objects import (
-    SignedTransaction,
-    SignedType1Transaction,
-    SignedType2Transaction,
-    Transaction,
-    Type1Transaction,
-    Type2Transaction,
-)
-from ledgereth.transactions import create_transaction, sign_transaction
 
-meta = metadata("ledgereth")
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# The version is written to _meta at build time.  Without it (e.g. running from
+# a bare source checkout) __getattr__ falls back to the installed metadata, as
+# it does for the author details.
+try:
+    from ledgereth import _meta
+except ImportError:
+    pass
+else:
+    __version__: str = _meta.version
+
+if TYPE_CHECKING:
+    from ledgereth.accounts import find_account, get_account_by_path, get_accounts
+    from ledgereth.messages import sign_message, sign_typed_data_draft
+    from ledgereth.objects import (
+        SignedTransaction,
+        SignedType1Transaction,
+        SignedType2Transaction,
+        Transaction,
+        Type1Transaction,
+        Type2Transaction,
+    )
+    from ledgereth.transactions import create_transaction, sign_transaction
+
+# The public API and the submodule each name lives in.  Submodules pull in
+# ledgerblue, eth_utils, and rlp, so they are only imported when first used.
+_LAZY_IMPORTS = {
+    "Transaction": "ledgereth.objects",
+    "Type1Transaction": "ledgereth.objects",
+    "Type2Transaction": "ledgereth.objects",
+    "SignedTransaction": "ledgereth.objects",
+    "SignedType1Transaction": "ledgereth.objects",
+    "SignedType2Transaction": "ledgereth.objects",
+    "create_transaction": "ledgereth.transactions",
+    "find_account": "ledgereth.accounts",
+    "get_account_by_path": "ledgereth.accounts",
+    "get_accounts": "ledgereth.accounts",
+    "sign_message": "ledgereth.messages",
+    "sign_transaction": "ledgereth.transactions",
+    "sign_typed_data_draft": "ledgereth.messages",
+}
+
+# Submodules that `import ledgereth` used to bind as attributes, imported on first
+# access too so e.g. `ledgereth.objects` keeps working
+_SUBMODULES = frozenset(
+    {
+        "accounts",
+        "comms",
+        "constants",
+        "exceptions",
+        "messages",
+        "objects",
+        "transactions",
+        "types",
+        "utils",
+    }
+)
 
 __all__ = [
     "Transaction",
@@ -29,6 +77,39 @@ __all__ = [
     "sign_transaction",
     "sign_typed_data_draft",
 ]
-__version__ = meta["Version"]
-__author__ = meta["Author-email"].split("<")[0].strip()
-__email__ = meta["Author-email"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public members and package metadata on first access."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    elif name in _SUBMODULES:
+        value = import_module(f"{__name__}.{name}")
+    elif name in ("meta", "__version__", "__author__", "__email__"):
+        from importlib.metadata import metadata
+
+        meta = metadata("ledgereth")
+        globals().setdefault("__version__", meta["Version"])
+        globals().setdefault("__author__", meta["Author-email"].split("<")[0].strip())
+        globals().setdefault("__email__", meta["Author-email"])
+        globals()["meta"] = meta
+        return globals()[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including those not yet imported."""
+    return sorted(
+        {
+            *globals(),
+            *_LAZY_IMPORTS,
+            *_SUBMODULES,
+            "__version__",
+            "__author__",
+            "__email__",
+        }
+    )
@@ -4,17 +4,10 @@ import argparse
 import sys
 from enum import IntEnum
 
-from eth_utils.hexadecimal import decode_hex
-
-from ledgereth import (
-    create_transaction,
-    find_account,
-    get_account_by_path,
-    get_accounts,
-    sign_message,
-    sign_typed_data_draft,
-)
-from ledgereth.comms import init_dongle
+# NOTE: ledgereth imports its submodules (and their heavy dependencies) lazily.
+# Only reference them from within commands so that `--help` and argument
+# errors stay fast.
+import ledgereth
 
 
 class ExitCodes(IntEnum):
@@ -165,10 +158,10 @@ def get_args(argv):
 def print_accounts(dongle, args):
     """Print accounts from the Ledger."""
     if args.path:
-        account = get_account_by_path(args.path, dongle)
+        account = ledgereth.get_account_by_path(args.path, dongle)
         print(f"Account {account.path} {account.address}")
     else:
-        accounts = get_accounts(dongle, count=args.count)
+        accounts = ledgereth.get_accounts(dongle, count=args.count)
         for i, a in enumerate(accounts):
             print(f"Account {i}: {a.path} {a.address}")
 
@@ -177,21 +170,19 @@ def send_value(dongle, args):
     """Send a value transaction from a Ledger account."""
     print(f"Sending {args.wei} ETH from {args.from_address} to {args.to_address}")
 
-    account = find_account(args.from_address, dongle)
+    account = ledgereth.find_account(args.from_address, dongle)
 
     if not account:
         print("Account not found on device", file=sys.stderr)
-        dongle.close()
         sys.exit(ExitCodes.INVALID_ARGUMENT)
 
     if not args.gasprice and not args.max_fee:
         print("Either --gasprice or --max-fee must be provided", file=sys.stderr)
-        dongle.close()
         sys.exit(ExitCodes.INVALID_ARGUMENT)
 
     to_address = args.to_address
 
-    signed = create_transaction(
+    signed = ledgereth.create_transaction(
         destination=to_address,
         amount=args.wei,
         gas=args.gas,
@@ -211,13 +202,13 @@ def sign_text_message(dongle, args):
     """Sign a text message with a Ledger account."""
     print(f'Signing "{args.message}" with {args.account_address}')
 
-    account = find_account(args.account_address, dongle)
+    account = ledgereth.find_account(args.account_address, dongle)
 
     if not account:
         print("Account not found on device", file=sys.stderr)
         return
 
-    signed = sign_message(args.message, account.path)
+    signed = ledgereth.sign_message(args.message, account.path)
 
     print(f"Signature: {signed.signature}")
 
@@ -228,13 +219,15 @@ def sign_typed_data(dongle, args):
     print(f"Domain hash: {args.domain_hash}")
     print(f"Message hash: {args.message_hash}")
 
-    account = find_account(args.account_address, dongle)
+    account = ledgereth.find_account(args.account_address, dongle)
 
     if not account:
         print("Account not found on device", file=sys.stderr)
         return
 
-    signed = sign_typed_data_draft(
+    from eth_utils.hexadecimal import decode_hex
+
+    signed = ledgereth.sign_typed_data_draft(
         decode_hex(args.domain_hash), decode_hex(args.message_hash), account.path
     )
 
@@ -253,14 +246,21 @@ def main(argv=sys.argv[1:]):
     """Main entry point for the CLI."""
     args = get_args(argv)
     command = args.command
+    handler = COMMANDS.get(command)
 
-    if command not in COMMANDS:
+    if handler is None:
         print(f"Invalid command: {command}", file=sys.stderr)
         sys.exit(ExitCodes.INVALID_ARGUMENT)
 
+    from ledgereth.comms import close_dongle, init_dongle
+
+    # Only touch the device once we know there's something to do with it
     dongle = init_dongle(debug=args.debug)
-    COMMANDS[command](dongle, args)
-    dongle.close()
+
+    try:
+        handler(dongle, args)
+    finally:
+        close_dongle()
 
 
 if __name__ == "__main__":
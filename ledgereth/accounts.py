@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from eth_utils.address import to_checksum_address
+import json
+from pathlib import Path
+from weakref import WeakKeyDictionary
+
+from eth_utils.address import is_hex_address
 
 from ledgereth.comms import (
     Dongle,
@@ -11,12 +15,151 @@ from ledgereth.comms import (
     init_dongle,
 )
 from ledgereth.constants import (
+    ACCOUNT_CACHE_DIR,
     DEFAULT_ACCOUNTS_FETCH,
     LEGACY_ACCOUNTS,
     MAX_ACCOUNTS_FETCH,
 )
 from ledgereth.objects import LedgerAccount
-from ledgereth.utils import parse_bip32_path
+from ledgereth.utils import checksum_address, encode_bip32_path, is_bip32_path
+
+#: Accounts already derived from each device, keyed by dongle then derivation path.
+#: Different devices (or seeds) derive different accounts for the same path, so
+#: accounts are never shared between dongles.
+ACCOUNT_CACHE: WeakKeyDictionary[Dongle, dict[str, LedgerAccount]] = WeakKeyDictionary()
+
+# Derivation path for an account index, and the paths for the indexes we search
+# by default, built once up front.
+_ACCOUNT_PATH_TEMPLATE = "44'/60'/0'/{}" if LEGACY_ACCOUNTS else "44'/60'/{}'/0/0"
+_ACCOUNT_PATHS = tuple(
+    _ACCOUNT_PATH_TEMPLATE.format(i)
+    for i in range(max(DEFAULT_ACCOUNTS_FETCH, MAX_ACCOUNTS_FETCH))
+)
+
+
+def clear_account_cache() -> None:
+    """Forget all previously derived accounts.
+
+    Derived accounts are cached for as long as the dongle they came from is
+    around.  Call this if you switch seeds on a device without reconnecting.
+    """
+    ACCOUNT_CACHE.clear()
+
+
+def _cached_accounts(dongle: Dongle) -> dict[str, LedgerAccount]:
+    """Return the account cache for a dongle."""
+    try:
+        return ACCOUNT_CACHE.setdefault(dongle, {})
+    except TypeError:
+        # Dongles that can't be weakly referenced just aren't cached
+        return {}
+
+
+def _account_path(index: int) -> str:
+    """Return the derivation path for the account at the given index."""
+    if index < len(_ACCOUNT_PATHS):
+        return _ACCOUNT_PATHS[index]
+    return _ACCOUNT_PATH_TEMPLATE.format(index)
+
+
+def _derive_account(path_string: str, dongle: Dongle) -> LedgerAccount:
+    """Ask the device for the account at the given path."""
+    data = encode_bip32_path(path_string)
+    response = dongle_send_data(dongle, "GET_ADDRESS_NO_CONFIRM", data)
+    return LedgerAccount(path_string, decode_response_address(response))
+
+
+def _saved_accounts_file(accounts: dict[str, LedgerAccount]) -> Path | None:
+    """Return the file accounts for the current device are saved to, if any.
+
+    Files are named for the first account's address, so another device or seed
+    never picks up the wrong accounts.
+    """
+    first_account = accounts.get(_account_path(0))
+
+    if not ACCOUNT_CACHE_DIR or first_account is None:
+        return None
+
+    return Path(ACCOUNT_CACHE_DIR) / f"{first_account.address}.json"
+
+
+def _load_saved_accounts(accounts: dict[str, LedgerAccount], dongle: Dongle) -> None:
+    """Populate a dongle's account cache with accounts saved by previous runs.
+
+    Loading is best effort.  Anything unreadable or malformed in the file is
+    skipped, and those accounts are derived from the device again.
+    """
+    accounts[_account_path(0)] = _derive_account(_account_path(0), dongle)
+    saved_file = _saved_accounts_file(accounts)
+
+    if saved_file is None:
+        return
+
+    try:
+        saved = json.loads(saved_file.read_text())
+    except (OSError, ValueError):
+        return
+
+    if not isinstance(saved, dict):
+        return
+
+    for path_string, address in saved.items():
+        if not (
+            isinstance(address, str)
+            and is_bip32_path(path_string)
+            and is_hex_address(address)
+        ):
+            continue
+
+        try:
+            account = LedgerAccount(path_string, address)
+        except (TypeError, ValueError):
+            continue
+
+        accounts.setdefault(path_string, account)
+
+
+def _save_accounts(accounts: dict[str, LedgerAccount]) -> None:
+    """Save a dongle's account cache for future runs."""
+    saved_file = _saved_accounts_file(accounts)
+
+    if saved_file is None:
+        return
+
+    saved = {path: account.address for path, account in accounts.items()}
+
+    # Saving is best effort, the accounts can always be derived again
+    try:
+        saved_file.parent.mkdir(parents=True, exist_ok=True)
+        saved_file.write_text(json.dumps(saved))
+    except OSError:
+        pass
+
+
+def _lookup_account(
+    path_string: str, dongle: Dongle, accounts: dict[str, LedgerAccount]
+) -> tuple[LedgerAccount, bool]:
+    """Return the account for a path, and if anything new was derived for it.
+
+    Callers save the cache (if enabled) once they're done deriving, rather than
+    after every account.
+    """
+    account = accounts.get(path_string)
+
+    if account is not None:
+        return account, False
+
+    if ACCOUNT_CACHE_DIR and not accounts:
+        _load_saved_accounts(accounts, dongle)
+        account = accounts.get(path_string)
+
+        if account is not None:
+            return account, True
+
+    account = _derive_account(path_string, dongle)
+    accounts[path_string] = account
+
+    return account, True
 
 
 def get_account_by_path(
@@ -31,14 +174,20 @@ def get_account_by_path(
     :return: :class:`ledgereth.objects.LedgerAccount` instance for the given
         account
 
+    .. note:: Accounts are cached by dongle and path after the first lookup.
+        See :func:`clear_account_cache`.  If the ``LEDGER_ACCOUNT_CACHE_DIR``
+        env var is set, they are also saved there for future runs.
+
     .. _`BIP-44`: https://en.bitcoin.it/wiki/BIP_0044
     """
     dongle = init_dongle(dongle)
-    path = parse_bip32_path(path_string)
-    data = (len(path) // 4).to_bytes(1, "big") + path
-    lc = len(data).to_bytes(1, "big")
-    response = dongle_send_data(dongle, "GET_ADDRESS_NO_CONFIRM", data, Lc=lc)
-    return LedgerAccount(path_string, decode_response_address(response))
+    cached = _cached_accounts(dongle)
+    account, derived = _lookup_account(path_string, dongle, cached)
+
+    if derived:
+        _save_accounts(cached)
+
+    return account
 
 
 def get_accounts(
@@ -52,16 +201,21 @@ def get_accounts(
     :return: list of :class:`ledgereth.objects.LedgerAccount` instances found on
         the ledger
     """
-    accounts = []
     dongle = init_dongle(dongle)
+    cached = _cached_accounts(dongle)
+    accounts = []
+    any_derived = False
 
+    # app-ethereum derives a single address per APDU, so there's no batching to
+    # be had on the device.  Instead, only the accounts missing from the
+    # dongle's cache are requested.
     for i in range(count):
-        if LEGACY_ACCOUNTS:
-            path_string = f"44'/60'/0'/{i}"
-        else:
-            path_string = f"44'/60'/{i}'/0/0"
-        account = get_account_by_path(path_string, dongle)
+        account, derived = _lookup_account(_account_path(i), dongle, cached)
         accounts.append(account)
+        any_derived = any_derived or derived
+
+    if any_derived:
+        _save_accounts(cached)
 
     return accounts
 
@@ -78,10 +232,22 @@ def find_account(
     :return: :class:`ledgereth.objects.LedgerAccount` instance if found on the
         Ledger
     """
-    address = to_checksum_address(address)
+    address = checksum_address(address)
+    dongle = init_dongle(dongle)
+    cached = _cached_accounts(dongle)
+    found = None
+    any_derived = False
+
+    # Derive one account at a time so we can stop as soon as we find it
+    for i in range(count):
+        account, derived = _lookup_account(_account_path(i), dongle, cached)
+        any_derived = any_derived or derived
 
-    for account in get_accounts(dongle, count):
         if account.address == address:
-            return account
+            found = account
+            break
+
+    if any_derived:
+        _save_accounts(cached)
 
-    return None
+    return found
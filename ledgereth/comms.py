@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from eth_utils.hexadecimal import add_0x_prefix
+import atexit
+from typing import ClassVar
+
 from ledgerblue.comm import getDongle
 from ledgerblue.commException import CommException
 from ledgerblue.Dongle import Dongle
 
-from ledgereth.constants import DEFAULT_PATH_ENCODED
+from ledgereth.constants import DEFAULT_PATH_ENCODED, SINGLE_BYTES
 from ledgereth.exceptions import LedgerError
 from ledgereth.objects import ISO7816Command
 
@@ -36,7 +38,7 @@ class LedgerCommands:
         INS=b"\x02",
         P1=b"\x00",  # 0x00 - Return addres | 0x01 - Confirm befor ereturning
         P2=b"\x00",  # 0x00 - No chain code | 0x01 - With chain code
-        data=(len(DEFAULT_PATH_ENCODED) // 4).to_bytes(1, "big") + DEFAULT_PATH_ENCODED,
+        data=SINGLE_BYTES[len(DEFAULT_PATH_ENCODED) // 4] + DEFAULT_PATH_ENCODED,
     )
 
     GET_ADDRESS_NO_CONFIRM = ISO7816Command(
@@ -81,31 +83,34 @@ class LedgerCommands:
         P2=b"\x00",
     )
 
-    @staticmethod
-    def get(name: str) -> bytes:
+    # All of the above, by name
+    _COMMANDS: ClassVar[dict[str, ISO7816Command]] = {
+        name: cmd for name, cmd in locals().items() if isinstance(cmd, ISO7816Command)
+    }
+
+    @classmethod
+    def get(cls, name: str) -> bytes:
         """Format a Ledger APDU command."""
-        if not hasattr(LedgerCommands, name):
-            raise ValueError("Command not available")
-        cmd = getattr(LedgerCommands, name)
-        return cmd.encode()
+        # Commands cache their own encoding, until they're changed
+        return cls._command(name).encode()
 
-    @staticmethod
+    @classmethod
     def get_with_data(
+        cls,
         name: str,
-        data: bytes,
+        data: bytes | memoryview,
         Lc: bytes | None = None,  # noqa: N803
         Le: bytes | None = None,  # noqa: N803
     ) -> bytes:
         """Format a Ledger APDU command with given data."""
-        if not hasattr(LedgerCommands, name):
-            raise ValueError("Command not available")
-        cmd = getattr(LedgerCommands, name)
-        cmd.set_data(data)
-        if Lc is not None:
-            cmd.Lc = Lc
-        if Le is not None:
-            cmd.Le = Le
-        return cmd.encode()
+        return cls._command(name).encode_with_data(data, Lc=Lc, Le=Le)
+
+    @classmethod
+    def _command(cls, name: str) -> ISO7816Command:
+        try:
+            return cls._COMMANDS[name]
+        except KeyError:
+            raise ValueError("Command not available") from None
 
 
 def dongle_send(dongle: Dongle, command_string: str) -> bytes | None:
@@ -120,7 +125,7 @@ def dongle_send(dongle: Dongle, command_string: str) -> bytes | None:
 def dongle_send_data(
     dongle: Dongle,
     command_string: str,
-    data: bytes,
+    data: bytes | memoryview,
     Lc: bytes | None = None,  # noqa: N803
     Le: bytes | None = None,  # noqa: N803
 ) -> bytes | None:
@@ -139,51 +144,45 @@ def decode_response_version_from_config(confbytes: bytes) -> str:
 
 def decode_response_address(response):
     """Decode an address response from the dongle."""
+    # Response is [pubkey len][pubkey][address len][address hex, no 0x prefix]
     offset = 1 + response[0]
-    address_encoded = response[offset + 1 : offset + 1 + response[offset]]
-    return add_0x_prefix(address_encoded.decode("ascii"))
+    address_len = response[offset]
+    offset += 1
+    # Decode straight out of the response buffer, without copying the slice
+    return "0x" + str(memoryview(response)[offset : offset + address_len], "ascii")
 
 
 def is_usable_version(confbytes: bytes) -> bool:
     """Only tested since 1.2.4 up to 1.10.0."""
-    version = decode_response_version_from_config(confbytes)
-    v_parts = version.split(".")
-    ver = [int(s) for s in v_parts]
+    version = (confbytes[1], confbytes[2], confbytes[3])
 
     # v9.9.9 is MockLedger
-    if ver[0] == 9:
+    if version[0] == 9:
         return True
 
-    # Major must be v1
-    if ver[0] != 1:
-        return False
-
-    # Minor must not be below 2 because untested
-    if ver[1] < 2:
-        return False
-
-    # Patch must not be below 4 if v1.2
-    if ver[1] == 2 and ver[2] < 4:
-        return False
-
-    return True
+    # Major must be v1, and not below v1.2.4 because untested
+    return (1, 2, 4) <= version < (2, 0, 0)
 
 
 def init_dongle(dongle: Dongle | None = None, debug: bool = False) -> Dongle:
     """Initialize the dongle and sanity check the connection."""
     global DONGLE_CACHE, DONGLE_CONFIG_CACHE
 
-    # If not given, use cache if available
-    if dongle is None and DONGLE_CACHE is None:
+    # If not given, use cache if available and not since closed
+    if dongle is None and (
+        DONGLE_CACHE is None or not getattr(DONGLE_CACHE, "opened", True)
+    ):
+        # A reopened device may not be the same one, so check it again
+        DONGLE_CONFIG_CACHE = None
+
         try:
             DONGLE_CACHE = getDongle(debug)  # type: ignore
         except CommException as err:
             raise LedgerError.transalate_comm_exception(err) from err
 
         # Sanity check the version
-        if DONGLE_CONFIG_CACHE is None or dongle is not None:
-            assert DONGLE_CACHE is not None
-            DONGLE_CONFIG_CACHE = dongle_send(DONGLE_CACHE, "GET_CONFIGURATION")
+        assert DONGLE_CACHE is not None
+        DONGLE_CONFIG_CACHE = dongle_send(DONGLE_CACHE, "GET_CONFIGURATION")
 
         if not DONGLE_CONFIG_CACHE or not is_usable_version(DONGLE_CONFIG_CACHE):
             raise NotImplementedError("Unsupported firmware version")
@@ -192,3 +191,20 @@ def init_dongle(dongle: Dongle | None = None, debug: bool = False) -> Dongle:
         raise Exception("Somehow failed to find a Ledger dongle without error!")
 
     return dongle or DONGLE_CACHE  # type: ignore
+
+
+def close_dongle() -> None:
+    """Close the dongle opened and cached by :func:`init_dongle`, if any.
+
+    This is done automatically at exit.
+    """
+    global DONGLE_CACHE, DONGLE_CONFIG_CACHE
+
+    if DONGLE_CACHE is not None:
+        DONGLE_CACHE.close()
+        DONGLE_CACHE = None
+
+    DONGLE_CONFIG_CACHE = None
+
+
+atexit.register(close_dongle)
@@ -6,9 +6,14 @@ from typing import Any
 
 def getenvint(key, default=0):
     """Get an int from en env var or use default."""
+    value = os.environ.get(key)
+
+    if value is None:
+        return default
+
     try:
-        return int(os.environ["MAX_ACCOUNTS_FETCH"])
-    except (KeyError, TypeError):
+        return int(value)
+    except ValueError:
         return default
 
 
@@ -24,19 +29,30 @@ MAX_ACCOUNTS_FETCH = getenvint("MAX_ACCOUNTS_FETCH", 5)
 # Whether to use the legacy bip32 path derivation used by Ledger Chrome app
 LEGACY_ACCOUNTS = os.getenv("LEDGER_LEGACY_ACCOUNTS") is not None
 
+# Directory to save derived accounts to between runs.  Disabled if not set.
+ACCOUNT_CACHE_DIR = os.getenv("LEDGER_ACCOUNT_CACHE_DIR")
+
+# Default derivation paths, pre-encoded so importing doesn't have to parse them.
+# The legacy path is the one used by the Ledger Chrome app.
 DEFAULT_PATH_STRING = "44'/60'/0'/0/0"
 DEFAULT_PATH_ENCODED = (
     b"\x80\x00\x00,\x80\x00\x00<\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
 )
+LEGACY_PATH_STRING = "44'/60'/0'/0"
+LEGACY_PATH_ENCODED = b"\x80\x00\x00,\x80\x00\x00<\x80\x00\x00\x00\x00\x00\x00\x00"
 if LEGACY_ACCOUNTS:
-    DEFAULT_PATH_STRING = "44'/60'/0'/0"
-    DEFAULT_PATH_ENCODED = b"\x80\x00\x00,\x80\x00\x00<\x80\x00\x00\x00\x00\x00\x00\x00"
+    DEFAULT_PATH_STRING = LEGACY_PATH_STRING
+    DEFAULT_PATH_ENCODED = LEGACY_PATH_ENCODED
 DEFAULT_PATH = DEFAULT_PATH_ENCODED.hex()
 VRS_RETURN_LENGTH = (65).to_bytes(1, "big")
 
 # Data size expected from Ledger
 DATA_CHUNK_SIZE = 255
 
+# Every single byte value, indexed by int, so lengths and flags can be looked up
+# rather than encoded each time
+SINGLE_BYTES = tuple(i.to_bytes(1, "big") for i in range(256))
+
 # Default "zero" values in EVM/Solidity
 DEFAULTS: dict[type, Any] = {
     int: 0,
@@ -53,10 +53,14 @@ class LedgerErrorCodes(IntEnum):
     @classmethod
     def get_by_value(cls, val):
         """Get the enum member by its value."""
-        try:
-            return cls(val)
-        except ValueError:
-            return None
+        name = ERROR_CODE_NAMES.get(val)
+        return None if name is None else cls[name]
+
+
+# Names of the known error codes, by status word
+ERROR_CODE_NAMES: Mapping[int, str] = {
+    code.value: code.name for code in LedgerErrorCodes
+}
 
 
 class LedgerError(Exception):
@@ -70,12 +74,13 @@ class LedgerError(Exception):
     @classmethod
     def transalate_comm_exception(cls, exp: CommException):
         """Translate a Ledger CommException to a LedgerError."""
-        return ERROR_CODE_EXCEPTIONS.get(
-            exp.sw,  # type: ignore
-            LedgerError(
-                f"Unexpected error: {hex(exp.sw)}"
-                f" {LedgerErrorCodes.get_by_value(exp.sw) or 'UNKNOWN'}"
-            ),
+        exc_class = ERROR_CODE_EXCEPTIONS.get(exp.sw)
+
+        if exc_class is not None:
+            return exc_class()
+
+        return LedgerError(
+            f"Unexpected error: {hex(exp.sw)} {ERROR_CODE_NAMES.get(exp.sw, 'UNKNOWN')}"
         )
 
 
@@ -103,7 +108,9 @@ class LedgerInvalid(LedgerError):  # noqa: D101, N818
     message = 'Invalid data sent to ledger or "blind signing" is not enabled'
 
 
-ERROR_CODE_EXCEPTIONS: Mapping[LedgerErrorCodes, type[LedgerError]] = {
+# Keyed by status word.  IntEnum members hash and compare as their int value, so
+# the raw int from a CommException looks them up directly.
+ERROR_CODE_EXCEPTIONS: Mapping[int, type[LedgerError]] = {
     LedgerErrorCodes.UKNOWN: LedgerNotFound,
     LedgerErrorCodes.DEVICE_LOCKED: LedgerLocked,
     LedgerErrorCodes.APP_SLEEP: LedgerAppNotOpened,
@@ -2,18 +2,18 @@
 
 from __future__ import annotations
 
-import binascii
 import struct
 
 from ledgereth.comms import Dongle, dongle_send_data, init_dongle
-from ledgereth.constants import DATA_CHUNK_SIZE, DEFAULT_PATH_STRING
+from ledgereth.constants import DATA_CHUNK_SIZE, DEFAULT_PATH_STRING, SINGLE_BYTES
 from ledgereth.objects import SignedMessage, SignedTypedMessage
 from ledgereth.types import Text
-from ledgereth.utils import (
-    chunks,
-    is_bip32_path,
-    parse_bip32_path,
-)
+from ledgereth.utils import encode_bip32_path, is_bip32_path
+
+
+def _as_bytes(text: Text) -> bytes:
+    """UTF-8 encode text given as a str."""
+    return text.encode("utf-8") if isinstance(text, str) else text
 
 
 def sign_message(
@@ -34,59 +34,36 @@ def sign_message(
 
     .. _`EIP-191`: https://eips.ethereum.org/EIPS/eip-191
     """
-    given_dongle = dongle is not None
-    dongle = init_dongle(dongle)
-    retval = None
+    message = _as_bytes(message)
 
-    if isinstance(message, str):
-        message = message.encode("utf-8")
+    if not is_bip32_path(sender_path):
+        raise ValueError("Invalid sender BIP32 path given to sign_transaction")
 
-    # Silence mypy due to type cohersion above
-    assert isinstance(message, bytes)
+    payload = b"".join(
+        (encode_bip32_path(sender_path), struct.pack(">I", len(message)), message)
+    )
+    # Chunks are views into the payload, it only gets copied into the APDUs
+    payload_view = memoryview(payload)
 
-    encoded = struct.pack(">I", len(message))
-    encoded += message
+    dongle = init_dongle(dongle)
+    retval = None
 
-    if not is_bip32_path(sender_path):
-        raise ValueError("Invalid sender BIP32 path given to sign_transaction")
+    # The first chunk starts the message, the rest are continuations
+    command = "SIGN_MESSAGE_FIRST_DATA"
 
-    path = parse_bip32_path(sender_path)
-    payload = (len(path) // 4).to_bytes(1, "big") + path + encoded
-
-    chunk_count = 0
-    for chunk in chunks(payload, DATA_CHUNK_SIZE):
-        chunk_size = len(chunk)
-
-        if chunk_count == 0:
-            retval = dongle_send_data(
-                dongle,
-                "SIGN_MESSAGE_FIRST_DATA",
-                chunk,
-                Lc=chunk_size.to_bytes(1, "big"),
-            )
-        else:
-            retval = dongle_send_data(
-                dongle,
-                "SIGN_MESSAGE_SECONDARY_DATA",
-                chunk,
-                Lc=chunk_size.to_bytes(1, "big"),
-            )
-        chunk_count += 1
+    for i in range(0, len(payload), DATA_CHUNK_SIZE):
+        chunk = payload_view[i : i + DATA_CHUNK_SIZE]
+        retval = dongle_send_data(dongle, command, chunk, Lc=SINGLE_BYTES[len(chunk)])
+        command = "SIGN_MESSAGE_SECONDARY_DATA"
 
     if retval is None or len(retval) < 64:
         raise Exception("Invalid response from Ledger")
 
-    v = int(retval[0])
-    r = int(binascii.hexlify(retval[1:33]), 16)
-    s = int(binascii.hexlify(retval[33:65]), 16)
+    v = retval[0]
+    r = int.from_bytes(retval[1:33], "big")
+    s = int.from_bytes(retval[33:65], "big")
 
-    signed = SignedMessage(message, v, r, s)
-
-    # If this func inited the dongle, then close it, otherwise core dump
-    if not given_dongle:
-        dongle.close()
-
-    return signed
+    return SignedMessage(message, v, r, s)
 
 
 def sign_typed_data_draft(
@@ -116,45 +93,28 @@ def sign_typed_data_draft(
     .. _`eth_account`: https://eth-account.readthedocs.io/
     .. _`ledgereth's unit tests`: https://github.com/mikeshultz/ledger-eth-lib/blob/2e47e7b9d70136a6dda0229c7bf516ed6bbe850f/tests/test_message_signing.py#L55-L74
     """
-    given_dongle = dongle is not None
-    dongle = init_dongle(dongle)
-    retval = None
-
-    if isinstance(domain_hash, str):
-        domain_hash = domain_hash.encode("utf-8")
-    if isinstance(message_hash, str):
-        message_hash = message_hash.encode("utf-8")
-
-    # Silence mypy due to type cohersion above
-    assert isinstance(domain_hash, bytes)
-    assert isinstance(message_hash, bytes)
-
-    encoded = domain_hash + message_hash
+    domain_hash = _as_bytes(domain_hash)
+    message_hash = _as_bytes(message_hash)
 
     if not is_bip32_path(sender_path):
         raise ValueError("Invalid sender BIP32 path given to sign_transaction")
 
-    path = parse_bip32_path(sender_path)
-    payload = (len(path) // 4).to_bytes(1, "big") + path + encoded
+    payload = b"".join((encode_bip32_path(sender_path), domain_hash, message_hash))
+
+    dongle = init_dongle(dongle)
 
     retval = dongle_send_data(
         dongle,
         "SIGN_TYPED_DATA",
         payload,
-        Lc=len(payload).to_bytes(1, "big"),
+        Lc=SINGLE_BYTES[len(payload)],
     )
 
     if retval is None or len(retval) < 64:
         raise Exception("Invalid response from Ledger")
 
-    v = int(retval[0])
-    r = int(binascii.hexlify(retval[1:33]), 16)
-    s = int(binascii.hexlify(retval[33:65]), 16)
-
-    signed = SignedTypedMessage(domain_hash, message_hash, v, r, s)
-
-    # If this func inited the dongle, then close it, otherwise core dump
-    if not given_dongle:
-        dongle.close()
+    v = retval[0]
+    r = int.from_bytes(retval[1:33], "big")
+    s = int.from_bytes(retval[33:65], "big")
 
-    return signed
+    return SignedTypedMessage(domain_hash, message_hash, v, r, s)
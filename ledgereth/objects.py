@@ -3,17 +3,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from enum import IntEnum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar
 
-from eth_utils.address import to_checksum_address
-from eth_utils.hexadecimal import encode_hex
 from rlp import Serializable, decode, encode
 from rlp.sedes import BigEndianInt, Binary, CountableList, big_endian_int, binary
 from rlp.sedes import List as ListSedes
 
-from ledgereth.constants import DEFAULT_CHAIN_ID
+from ledgereth.constants import DEFAULT_CHAIN_ID, SINGLE_BYTES
 from ledgereth.utils import (
+    checksum_address,
     coerce_list_types,
     is_bip32_path,
     is_bytes,
@@ -41,24 +42,40 @@ RPC_TX_PROP_TRANSLATION = {
     "access_list": "accessList",
     "chain_id": "chainId",
 }
-RPC_TX_PROPS = [
-    "chainId",
-    "from",
-    "to",
-    "gas",
-    "gasPrice",
-    "value",
-    "data",
-    "nonce",
-    "maxFeePerGas",
-    "maxPriorityFeePerGas",
-    "chainId",
-    "accessList",
-]
+RPC_TX_PROPS = frozenset(
+    {
+        "chainId",
+        "from",
+        "to",
+        "gas",
+        "gasPrice",
+        "value",
+        "data",
+        "nonce",
+        "maxFeePerGas",
+        "maxPriorityFeePerGas",
+        "accessList",
+    }
+)
+# Legacy transactions are bare RLP lists, which always start with a byte of at
+# least 0xC0.  EIP-2718 typed transactions start with a type byte of at most 0x7F.
+# Anything in between is an RLP string prefix, and not a transaction at all.
+RLP_LIST_PREFIX = 0xC0
+MAX_TRANSACTION_TYPE = 0x7F
 MAX_LEGACY_CHAIN_ID = 0xFFFFFFFF + 1
 MAX_CHAIN_ID = 0x38D7EA4C67FFF
 
 
+def _sedes_type(sedes: Any) -> type | None:
+    """Python type decoded RLP values of a sedes are coerced to, if any."""
+    if isinstance(sedes, BigEndianInt):
+        return int
+    if isinstance(sedes, Binary):
+        return bytes
+    # Left as decoded (e.g. access lists)
+    return None
+
+
 class TransactionType(IntEnum):
     """An Ethereum EIP-2718 transaction type."""
 
@@ -71,12 +88,14 @@ class TransactionType(IntEnum):
 
     def to_byte(self):
         """Decode TransactionType to a single byte."""
-        return self.value.to_bytes(1, "big")
+        return SINGLE_BYTES[self.value]
 
 
 class ISO7816Command:
     """An ISO-7816 APDU Command binary to be sent to the Ledger device."""
 
+    __slots__ = ("CLA", "INS", "Lc", "Le", "P1", "P2", "_encoded", "data")
+
     def __init__(
         self,
         CLA: bytes,  # noqa: N803
@@ -103,10 +122,26 @@ class ISO7816Command:
         self.INS = INS
         self.P1 = P1
         self.P2 = P2
-        self.Lc = Lc or b"\x00" if not data else len(data).to_bytes(1, "big")
+
+        if Lc is not None:
+            self.Lc = Lc
+        elif data:
+            if len(data) > 255:
+                raise ValueError("Command data exceeds the max chunk length of 255")
+            self.Lc = SINGLE_BYTES[len(data)]
+        else:
+            self.Lc = b"\x00"
+
         self.Le = Le
         self.data = data
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a command part, forgetting the command's cached encoding."""
+        object.__setattr__(self, name, value)
+
+        if name != "_encoded":
+            object.__setattr__(self, "_encoded", None)
+
     def set_data(self, data: bytes, Lc: bytes | None = None) -> None:  # noqa: N803
         """Set the command data and its length.
 
@@ -121,7 +156,7 @@ class ISO7816Command:
             return
 
         if Lc is None:
-            self.Lc = len(self.data).to_bytes(1, "big")
+            self.Lc = SINGLE_BYTES[len(self.data)]
         else:
             self.Lc = Lc
 
@@ -130,20 +165,49 @@ class ISO7816Command:
 
         :return: Encoded ``bytes`` data
         """
-        encoded = self.CLA + self.INS + self.P1 + self.P2
+        # Commands rarely change, so they're only encoded again when they do
+        if self._encoded is None:
+            # A single join is cheaper than concatenating (and copying) piece by piece
+            self._encoded = b"".join(
+                (
+                    self.CLA,
+                    self.INS,
+                    self.P1,
+                    self.P2,
+                    self.Lc,
+                    self.data or b"",
+                    self.Le or b"",
+                )
+            )
+
+        return self._encoded
 
-        if self.data is not None:
-            if self.Lc is None:
-                self.Lc = (len(self.data)).to_bytes(1, "big")
-            encoded += self.Lc
-            encoded += self.data
+    def encode_with_data(
+        self,
+        data: bytes | memoryview,
+        Lc: bytes | None = None,  # noqa: N803
+        Le: bytes | None = None,  # noqa: N803
+    ) -> bytes:
+        """Encode the command with the given data, leaving the command unchanged.
+
+        :param data: (:class:`bytes`) - The raw ``bytes`` data. This must not
+            exceed the max chunk length of 255
+        :param Lc: (:class:`bytes`) - The length of the data.  Defaults to the
+            length of ``data``
+        :param Le: (:class:`bytes`) - Expected response length.  Defaults to the
+            command's own ``Le``
+        :return: Encoded ``bytes`` data
+        """
+        if Lc is None:
+            if len(data) > 255:
+                raise ValueError("Command data exceeds the max chunk length of 255")
+            lc = SINGLE_BYTES[len(data)]
         else:
-            encoded += self.Lc
+            lc = Lc
 
-        if self.Le is not None:
-            encoded += self.Le
+        le = self.Le if Le is None else Le
 
-        return encoded
+        return b"".join((self.CLA, self.INS, self.P1, self.P2, lc, data, le or b""))
 
     def encode_hex(self) -> str:
         """Encode the command into hex bytes representation.
@@ -156,6 +220,8 @@ class ISO7816Command:
 class LedgerAccount:
     """An account derived from the private key on a Ledger device."""
 
+    __slots__ = ("address", "path", "path_encoded")
+
     #: The HD path of the account
     path: str
 
@@ -176,7 +242,7 @@ class LedgerAccount:
 
         self.path = path
         self.path_encoded = parse_bip32_path(path)
-        self.address = to_checksum_address(address)
+        self.address = checksum_address(address)
 
     def __repr__(self):
         return f"<ledgereth.objects.LedgerAccount {self.address}>"
@@ -193,6 +259,27 @@ class LedgerAccount:
 class SerializableTransaction(Serializable):
     """An RLP Serializable transaction object."""
 
+    # (field name, RPC key) for the fields included by to_rpc_dict().  Built once
+    # for each class when it's defined.
+    _rpc_fields: ClassVar[tuple[tuple[str, str], ...]] = ()
+    # Types decoded fields are coerced to by from_rawtx(), in field order.  Also
+    # built once for each class from its fields' sedes.
+    _field_types: ClassVar[tuple[type | None, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        rpc_fields = []
+
+        for name in cls._meta.field_names:
+            key = RPC_TX_PROP_TRANSLATION.get(name, name)
+
+            if key in RPC_TX_PROPS:
+                rpc_fields.append((name, key))
+
+        cls._rpc_fields = tuple(rpc_fields)
+        cls._field_types = tuple(_sedes_type(sedes) for _, sedes in cls._meta.fields)
+
     @classmethod
     @abstractmethod
     def from_rawtx(cls, rawtx: bytes) -> SerializableTransaction:
@@ -203,47 +290,48 @@ class SerializableTransaction(Serializable):
         :return: Instantiated :class:`ledgereth.objects.SerializableTransaction`
         """
 
+    # Field values by name, built on first use.  Transactions are immutable, so
+    # it never needs to be rebuilt.
+    _dict_cache: dict[str, Any] | None = None
+
+    def as_mapping(self) -> Mapping[str, Any]:
+        """Return a read-only mapping of the transaction's fields.
+
+        Unlike :meth:`to_dict`, this does not make a new ``dict`` on each call.
+
+        :return: Read-only transaction mapping
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                name: getattr(self, name) for name in self._meta.field_names
+            }
+
+        return MappingProxyType(self._dict_cache)
+
     def to_dict(self) -> dict[str, Any]:
         """Return a dictionary representation of the transaction.
 
         :return: Transaction dict
         """
-        d = {}
-        for name, _ in self.__class__._meta.fields:
-            d[name] = getattr(self, name)
-        return d
+        return dict(self.as_mapping())
 
     def to_rpc_dict(self) -> dict[str, Any]:
         """To a dict compatible with web3.py or JSON-RPC.
 
         :return: Transaction dict
         """
-        d: dict[str, Any] = {}
-
-        for name, _ in self.__class__._meta.fields:
-            key = (
-                RPC_TX_PROP_TRANSLATION[name]
-                if name in RPC_TX_PROP_TRANSLATION
-                else name
-            )
-
-            if key in RPC_TX_PROPS:
-                # Need to format an access list differently for web3/RPC-like
-                # objects.  It expects a list of objects
-                if key == "accessList":
-                    orig = getattr(self, name)
-                    d[key] = []
-                    for item in orig:
-                        d[key].append(
-                            {
-                                "address": item[0],
-                                "storageKeys": [
-                                    int.from_bytes(slot, "big") for slot in item[1]
-                                ],
-                            }
-                        )
-                else:
-                    d[key] = getattr(self, name)
+        d: dict[str, Any] = {key: getattr(self, name) for name, key in self._rpc_fields}
+
+        # Need to format an access list differently for web3/RPC-like
+        # objects.  It expects a list of objects
+        if "accessList" in d:
+            d["accessList"] = [
+                {
+                    "address": item[0],
+                    "storageKeys": [int.from_bytes(slot, "big") for slot in item[1]],
+                }
+                for item in d["accessList"]
+            ]
 
         return d
 
@@ -333,14 +421,10 @@ class Transaction(SerializableTransaction):
         :param rawtx: (``bytes``) A raw transaction to instantiate with
         :returns: :class:`ledgereth.objects.Transaction`
         """
-        if rawtx[0] < 127:
+        if rawtx[0] < RLP_LIST_PREFIX:
             raise ValueError("Transaction is not a legacy transaction")
 
-        return Transaction(
-            *coerce_list_types(
-                [int, int, int, bytes, int, bytes, int, int, int], decode(rawtx)
-            )
-        )
+        return Transaction(*coerce_list_types(cls._field_types, decode(rawtx)))
 
 
 class Type1Transaction(SerializableTransaction):
@@ -394,8 +478,6 @@ class Type1Transaction(SerializableTransaction):
         :param access_list: (``list[tuple[bytes, list[int]]] | None``) EIP-2718 Access
             list
         """
-        access_list = access_list or []
-
         if chain_id > MAX_CHAIN_ID:
             """Chain IDs above 999999999999999 cause app-ethereum to throw an error
             because its unable to render on the device.
@@ -415,7 +497,8 @@ class Type1Transaction(SerializableTransaction):
             destination,
             amount,
             data,
-            access_list,
+            # rlp stores sequences as tuples anyway, so no need for a new list
+            access_list or (),
         )
 
     @classmethod
@@ -430,12 +513,7 @@ class Type1Transaction(SerializableTransaction):
                 f"Transaction is not a type {cls.transaction_type} transaction"
             )
 
-        return Type1Transaction(
-            *coerce_list_types(
-                [int, int, int, int, bytes, int, bytes, None],
-                decode(rawtx[1:]),
-            )
-        )
+        return Type1Transaction(*coerce_list_types(cls._field_types, decode(rawtx[1:])))
 
 
 class Type2Transaction(SerializableTransaction):
@@ -493,8 +571,6 @@ class Type2Transaction(SerializableTransaction):
         :param access_list: (``list[tuple[bytes, list[int]]]``) EIP-2718 Access
             list
         """
-        access_list = access_list or []
-
         if chain_id > MAX_CHAIN_ID:
             """Chain IDs above 999999999999999 cause app-ethereum to throw an error
             because its unable to render on the device.
@@ -515,7 +591,8 @@ class Type2Transaction(SerializableTransaction):
             destination,
             amount,
             data,
-            access_list,
+            # rlp stores sequences as tuples anyway, so no need for a new list
+            access_list or (),
         )
 
     @classmethod
@@ -530,12 +607,7 @@ class Type2Transaction(SerializableTransaction):
                 f"Transaction is not a type {cls.transaction_type} transaction"
             )
 
-        return Type2Transaction(
-            *coerce_list_types(
-                [int, int, int, int, int, bytes, int, bytes, None],
-                decode(rawtx[1:]),
-            )
-        )
+        return Type2Transaction(*coerce_list_types(cls._field_types, decode(rawtx[1:])))
 
 
 class SignedTransaction(SerializableTransaction):
@@ -591,12 +663,10 @@ class SignedTransaction(SerializableTransaction):
         :param rawtx: (``bytes``) A raw signed transaction to instantiate with
         :returns: :class:`ledgereth.objects.SignedTransaction`
         """
-        if rawtx[0] < 127:
+        if rawtx[0] < RLP_LIST_PREFIX:
             raise ValueError("Transaction is not a legacy transaction")
 
-        return SignedTransaction(
-            *coerce_list_types([int, int, int, int, bytes, int, bytes], decode(rawtx))
-        )
+        return SignedTransaction(*coerce_list_types(cls._field_types, decode(rawtx)))
 
     def raw_transaction(self):
         """Return an encoded raw signed transaction.
@@ -609,11 +679,23 @@ class SignedTransaction(SerializableTransaction):
 
         :returns: Encoded raw signed transaction bytes
         """  # noqa: E501
-        return encode_hex(encode(self, SignedTransaction))
+        return "0x" + self.raw_transaction_bytes().hex()
+
+    def raw_transaction_bytes(self) -> bytes:
+        """Return an encoded raw signed transaction as ``bytes``.
+
+        The same as :meth:`raw_transaction`, without the hex encoding.
+
+        :returns: Encoded raw signed transaction bytes
+        """
+        # Without a sedes, rlp caches the encoding on the (immutable) instance
+        return bytes(encode(self))
 
     # Match the API of the web3.py Transaction object
     #: Encoded raw signed transaction
     rawTransaction = property(raw_transaction)  # noqa: N815
+    #: Encoded raw signed transaction ``bytes``
+    rawTransactionBytes = property(raw_transaction_bytes)  # noqa: N815
 
 
 class SignedType1Transaction(SerializableTransaction):
@@ -692,10 +774,7 @@ class SignedType1Transaction(SerializableTransaction):
             )
 
         return SignedType1Transaction(
-            *coerce_list_types(
-                [int, int, int, int, bytes, int, bytes, None, int, int, int],
-                decode(rawtx[1:]),
-            )
+            *coerce_list_types(cls._field_types, decode(rawtx[1:]))
         )
 
     def raw_transaction(self):
@@ -709,11 +788,24 @@ class SignedType1Transaction(SerializableTransaction):
 
         :returns: Encoded raw signed transaction bytes
         """  # noqa: E501
-        return encode_hex(b"\x01" + bytes(encode(self, SignedType1Transaction)))
+        # Prefix the hex rather than copying the whole payload to prefix the bytes.
+        # Without a sedes, rlp caches the encoding on the (immutable) instance.
+        return "0x01" + bytes(encode(self)).hex()
+
+    def raw_transaction_bytes(self) -> bytes:
+        """Return an encoded raw signed transaction as ``bytes``.
+
+        The same as :meth:`raw_transaction`, without the hex encoding.
+
+        :returns: Encoded raw signed transaction bytes
+        """
+        return self.transaction_type.to_byte() + bytes(encode(self))
 
     # Match the API of the web3.py Transaction object
     #: Encoded raw signed transaction
     rawTransaction = property(raw_transaction)  # noqa: N815
+    #: Encoded raw signed transaction ``bytes``
+    rawTransactionBytes = property(raw_transaction_bytes)  # noqa: N815
 
 
 class SignedType2Transaction(SerializableTransaction):
@@ -798,23 +890,7 @@ class SignedType2Transaction(SerializableTransaction):
             )
 
         return SignedType2Transaction(
-            *coerce_list_types(
-                [
-                    int,
-                    int,
-                    int,
-                    int,
-                    int,
-                    bytes,
-                    int,
-                    bytes,
-                    None,
-                    int,
-                    int,
-                    int,
-                ],
-                decode(rawtx[1:]),
-            )
+            *coerce_list_types(cls._field_types, decode(rawtx[1:]))
         )
 
     def raw_transaction(self):
@@ -828,16 +904,31 @@ class SignedType2Transaction(SerializableTransaction):
 
         :returns: Encoded raw signed transaction bytes
         """  # noqa: E501
-        return encode_hex(b"\x02" + bytes(encode(self, SignedType2Transaction)))
+        # Prefix the hex rather than copying the whole payload to prefix the bytes.
+        # Without a sedes, rlp caches the encoding on the (immutable) instance.
+        return "0x02" + bytes(encode(self)).hex()
+
+    def raw_transaction_bytes(self) -> bytes:
+        """Return an encoded raw signed transaction as ``bytes``.
+
+        The same as :meth:`raw_transaction`, without the hex encoding.
+
+        :returns: Encoded raw signed transaction bytes
+        """
+        return self.transaction_type.to_byte() + bytes(encode(self))
 
     # Match the API of the web3.py Transaction object
     #: Encoded raw signed transaction
     rawTransaction = property(raw_transaction)  # noqa: N815
+    #: Encoded raw signed transaction ``bytes``
+    rawTransactionBytes = property(raw_transaction_bytes)  # noqa: N815
 
 
 class Signed(ABC):
     """A signed object."""
 
+    __slots__ = ("r", "s", "v")
+
     #: Signature v
     v: int
     #: Signature r
@@ -857,19 +948,26 @@ class Signed(ABC):
 
         :returns: Signature ``bytes``
         """
-        if not self.v or not self.r or not self.s:
+        # Zero is a valid value (e.g. a v/y-parity of 0), only None is missing
+        if self.v is None or self.r is None or self.s is None:
             raise ValueError("Missing v, r, or s")
 
-        return encode_hex(
-            self.r.to_bytes(32, "big")
-            + self.s.to_bytes(32, "big")
-            + self.v.to_bytes(1, "big")
+        signature = b"".join(
+            (
+                self.r.to_bytes(32, "big"),
+                self.s.to_bytes(32, "big"),
+                self.v.to_bytes(1, "big"),
+            )
         )
 
+        return "0x" + signature.hex()
+
 
 class SignedMessage(Signed):
     """Signed EIP-191 message."""
 
+    __slots__ = ("message",)
+
     message: bytes
 
     def __init__(self, message, v, r, s):
@@ -887,6 +985,8 @@ class SignedMessage(Signed):
 class SignedTypedMessage(Signed):
     """Signed EIP-812 typed data."""
 
+    __slots__ = ("domain_hash", "message_hash")
+
     domain_hash: bytes
     message_hash: bytes
 
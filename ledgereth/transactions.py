@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-import binascii
-
 from eth_utils.hexadecimal import decode_hex
 from rlp import Serializable, encode
 
 from ledgereth.comms import Dongle, dongle_send_data, init_dongle
-from ledgereth.constants import DATA_CHUNK_SIZE, DEFAULT_CHAIN_ID, DEFAULT_PATH_STRING
+from ledgereth.constants import (
+    DATA_CHUNK_SIZE,
+    DEFAULT_CHAIN_ID,
+    DEFAULT_PATH_STRING,
+    SINGLE_BYTES,
+)
 from ledgereth.objects import (
+    MAX_TRANSACTION_TYPE,
+    RLP_LIST_PREFIX,
     SerializableTransaction,
     SignedTransaction,
     SignedType1Transaction,
@@ -21,13 +26,20 @@ from ledgereth.objects import (
 )
 from ledgereth.types import AccessList, AccessListInput, Text
 from ledgereth.utils import (
-    chunks,
     coerce_access_list,
+    encode_bip32_path,
     is_bip32_path,
     is_hex_string,
-    parse_bip32_path,
 )
 
+# (unsigned, signed) transaction classes, by EIP-2718 transaction type prefix
+TYPED_TRANSACTION_CLASSES: dict[
+    int, tuple[type[SerializableTransaction], type[SerializableTransaction]]
+] = {
+    TransactionType.EIP_2930: (Type1Transaction, SignedType1Transaction),
+    TransactionType.EIP_1559: (Type2Transaction, SignedType2Transaction),
+}
+
 
 def sign_transaction(
     tx: Serializable,
@@ -47,16 +59,12 @@ def sign_transaction(
     :return: :class:`ledgereth.objects.SignedTransaction` instance for
         transaction
     """
-    given_dongle = dongle is not None
-    dongle = init_dongle(dongle)
-    retval = None
-
+    # Without a sedes, rlp caches the encoding on the (immutable) transaction, so
+    # signing the same transaction again doesn't re-serialize it
     if isinstance(tx, Transaction):
-        encoded_tx = encode(tx, Transaction)
-    elif isinstance(tx, Type1Transaction):
-        encoded_tx = tx.transaction_type.to_byte() + encode(tx, Type1Transaction)
-    elif isinstance(tx, Type2Transaction):
-        encoded_tx = tx.transaction_type.to_byte() + encode(tx, Type2Transaction)
+        encoded_tx = encode(tx)
+    elif isinstance(tx, (Type1Transaction, Type2Transaction)):
+        encoded_tx = tx.transaction_type.to_byte() + encode(tx)
     else:
         raise ValueError(
             "Only Transaction and Type2Transaction objects are currently supported"
@@ -65,35 +73,27 @@ def sign_transaction(
     if not is_bip32_path(sender_path):
         raise ValueError("Invalid sender BIP32 path given to sign_transaction")
 
-    path = parse_bip32_path(sender_path)
-    payload = (len(path) // 4).to_bytes(1, "big") + path + bytes(encoded_tx)
+    payload = encode_bip32_path(sender_path) + bytes(encoded_tx)
+    # Chunks are views into the payload, it only gets copied into the APDUs
+    payload_view = memoryview(payload)
 
-    chunk_count = 0
-    for chunk in chunks(payload, DATA_CHUNK_SIZE):
-        chunk_size = len(chunk)
+    dongle = init_dongle(dongle)
+    retval = None
 
-        if chunk_count == 0:
-            retval = dongle_send_data(
-                dongle,
-                "SIGN_TX_FIRST_DATA",
-                chunk,
-                Lc=chunk_size.to_bytes(1, "big"),
-            )
-        else:
-            retval = dongle_send_data(
-                dongle,
-                "SIGN_TX_SECONDARY_DATA",
-                chunk,
-                Lc=chunk_size.to_bytes(1, "big"),
-            )
-        chunk_count += 1
+    # The first chunk starts the transaction, the rest are continuations
+    command = "SIGN_TX_FIRST_DATA"
+
+    for i in range(0, len(payload), DATA_CHUNK_SIZE):
+        chunk = payload_view[i : i + DATA_CHUNK_SIZE]
+        retval = dongle_send_data(dongle, command, chunk, Lc=SINGLE_BYTES[len(chunk)])
+        command = "SIGN_TX_SECONDARY_DATA"
 
     if retval is None or len(retval) < 64:
         raise Exception("Invalid response from Ledger")
 
     chain_id = tx.chain_id or DEFAULT_CHAIN_ID
-    r = int(binascii.hexlify(retval[1:33]), 16)
-    s = int(binascii.hexlify(retval[33:65]), 16)
+    r = int.from_bytes(retval[1:33], "big")
+    s = int.from_bytes(retval[33:65], "big")
 
     if tx.transaction_type < TransactionType.EIP_2930:
         if (chain_id * 2 + 35) + 1 > 255:
@@ -146,10 +146,6 @@ def sign_transaction(
                 sender_s=s,
             )
 
-    # If this func inited the dongle, then close it, otherwise core dump
-    if not given_dongle:
-        dongle.close()
-
     return signed
 
 
@@ -194,9 +190,6 @@ def create_transaction(
     .. _`BIP-44`: https://en.bitcoin.it/wiki/BIP_0044
     .. _`EIP-2930`: https://eips.ethereum.org/EIPS/eip-2930
     """
-    given_dongle = dongle is not None
-    dongle = init_dongle(dongle)
-
     if isinstance(destination, str) and is_hex_string(destination):
         destination = decode_hex(destination)
 
@@ -265,13 +258,8 @@ def create_transaction(
             chain_id=chain_id,
         )
 
-    signed = sign_transaction(tx, sender_path, dongle=dongle)
-
-    # If this func inited the dongle, then close it, otherwise core dump
-    if not given_dongle:
-        dongle.close()
-
-    return signed
+    # sign_transaction opens (and closes) the dongle if one wasn't given
+    return sign_transaction(tx, sender_path, dongle=dongle)
 
 
 def decode_transaction(rawtx: bytes, signed: bool = False) -> SerializableTransaction:
@@ -285,21 +273,20 @@ def decode_transaction(rawtx: bytes, signed: bool = False) -> SerializableTransa
     """
     tx_type = rawtx[0]
 
-    if tx_type < 127:
-        if tx_type == 1:
-            if signed:
-                return SignedType1Transaction.from_rawtx(rawtx)
-            else:
-                return Type1Transaction.from_rawtx(rawtx)
-        elif tx_type == 2:
-            if signed:
-                return SignedType2Transaction.from_rawtx(rawtx)
-            else:
-                return Type2Transaction.from_rawtx(rawtx)
-        else:
+    if MAX_TRANSACTION_TYPE < tx_type < RLP_LIST_PREFIX:
+        raise ValueError("Transaction is not a valid raw transaction")
+
+    if tx_type <= MAX_TRANSACTION_TYPE:
+        tx_classes = TYPED_TRANSACTION_CLASSES.get(tx_type)
+
+        if tx_classes is None:
             raise NotImplementedError(
                 f"Support for transaction type {tx_type} has not yet been implemented"
             )
+
+        unsigned_class, signed_class = tx_classes
+
+        return (signed_class if signed else unsigned_class).from_rawtx(rawtx)
     elif signed:
         return SignedTransaction.from_rawtx(rawtx)
 
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import re
 import struct
-from collections.abc import Collection, Generator
+from collections.abc import Collection, Generator, Sequence
+from functools import lru_cache
 from typing import Any, Callable
 
+from eth_utils.address import to_checksum_address
 from eth_utils.hexadecimal import decode_hex
 
-from ledgereth.constants import DEFAULTS
+from ledgereth.constants import DEFAULTS, SINGLE_BYTES
 from ledgereth.types import AccessList, AccessListInput
 
 # 44'/60'/0'/0/x
@@ -29,11 +31,22 @@ def is_optional_bytes(v: Any | None) -> bool:
     return v is None or is_bytes(v)
 
 
+@lru_cache(maxsize=1024)
+def checksum_address(address: str | bytes) -> str:
+    """Return the EIP-55 checksummed form of an address.
+
+    Checksumming hashes the address and the same few addresses tend to come up
+    over and over again, so results are cached.
+    """
+    return to_checksum_address(address)
+
+
 def is_hex_string(v: Any) -> bool:
     """Detect if a string is a hex string."""
     return isinstance(v, str) and v.startswith("0x")
 
 
+@lru_cache(maxsize=256)
 def is_bip32_path(path: str) -> bool:
     """Detect if a string a bip32 path that can be given to a Ledger device."""
     return (
@@ -47,38 +60,47 @@ def chunks(it: bytes, chunk_size: int) -> Generator[bytes, None, None]:
     if not isinstance(it, bytes):
         raise TypeError("iterable argument must be type bytes")
 
-    it_size = len(it)
-
-    if it_size <= chunk_size:
+    if not it:
         yield it
-    else:
-        chunk_count, remainder = divmod(it_size, chunk_size)
-        for i in range(0, chunk_count * chunk_size, chunk_size):
-            yield it[i : i + chunk_size]
-        final_offset = chunk_count * chunk_size
-        yield it[final_offset : final_offset + remainder]
+        return
+
+    for i in range(0, len(it), chunk_size):
+        yield it[i : i + chunk_size]
 
 
+@lru_cache(maxsize=256)
 def parse_bip32_path(path: str) -> bytes:
-    """Parse a BIP-32/44 string path into bytes."""
+    """Parse a BIP-32/44 string path into bytes.
+
+    Results are cached, since the same handful of paths tend to be used over and
+    over again.
+    """
     if not path:
         return b""
 
-    result = b""
-    elements = path.split("/")
+    indexes = []
 
-    for path_element in elements:
-        element = path_element.split("'")
+    for path_element in path.split("/"):
+        index, tick, _ = path_element.partition("'")
 
-        # Wihout tick (') == 1
-        if len(element) == 1:
-            # "public" BIP-44 derivation
-            result = result + struct.pack(">I", int(element[0]))
-        else:
+        if tick:
             # "private" BIP-44 derivation
-            result = result + struct.pack(">I", 0x80000000 | int(element[0]))
+            indexes.append(0x80000000 | int(index))
+        else:
+            # "public" BIP-44 derivation
+            indexes.append(int(index))
 
-    return result
+    return struct.pack(f">{len(indexes)}I", *indexes)
+
+
+@lru_cache(maxsize=256)
+def encode_bip32_path(path: str) -> bytes:
+    """Encode a BIP-32/44 string path as sent to the Ledger device.
+
+    This is the parsed path prefixed by a byte with its depth (element count).
+    """
+    encoded = parse_bip32_path(path)
+    return SINGLE_BYTES[len(encoded) // 4] + encoded
 
 
 def decode_bip32_path(path: bytes) -> str:
@@ -202,7 +224,7 @@ def coerce_access_list(access_list: AccessList | AccessListInput) -> AccessList:
 
 
 def coerce_list_types(
-    types: list[type | None], to_coerce: list[Any | None]
+    types: Sequence[type | None], to_coerce: list[Any | None]
 ) -> list[Any]:
     """Coerce types of a list to given types in order."""
     for i, v in enumerate(to_coerce):
@@ -24,10 +24,10 @@ USE_REAL_DONGLE = os.environ.get("USE_REAL_DONGLE") is not None
 Account.enable_unaudited_hdwallet_features()
 
 
-def get_account_by_path(path: bytes) -> LocalAccount:
+def get_account_by_path(path: bytes, mnemonic: str = TEST_MNEMONIC) -> LocalAccount:
     """Get a test account by derivation path."""
     path_string = decode_bip32_path(path)
-    return Account.from_mnemonic(TEST_MNEMONIC, account_path=f"m/{path_string}")
+    return Account.from_mnemonic(mnemonic, account_path=f"m/{path_string}")
 
 
 class MockDongle:
@@ -38,8 +38,10 @@ class MockDongle:
     attached.
     """
 
-    def __init__(self):
+    def __init__(self, mnemonic: str = TEST_MNEMONIC):
         """Initialize a mock dongle."""
+        self.mnemonic = mnemonic
+        self.opened = True
         self._reset()
 
     def _reset(self):
@@ -93,7 +95,7 @@ class MockDongle:
     def _handle_get_address(self, lc, data):
         # First byte is len(path) // 4
         encoded_path = data[1 : lc + 1]
-        account = get_account_by_path(encoded_path)
+        account = get_account_by_path(encoded_path, self.mnemonic)
 
         # This "junk" might mean something in the actual Ledger response, but I
         # don't know what it is and it's not needed to get the address.
@@ -112,7 +114,7 @@ class MockDongle:
     def _handle_tx_first_data(self, lc, data):
         path_length = data[0] * 4
         encoded_path = data[1 : path_length + 1]
-        self.account = get_account_by_path(encoded_path)
+        self.account = get_account_by_path(encoded_path, self.mnemonic)
 
         # Push this tx data onto the stack
         self.stack.append(data[path_length + 1 :])
@@ -133,7 +135,7 @@ class MockDongle:
         path_length = data[0] * 4
         path_end = path_length + 1
         encoded_path = data[1:path_end]
-        self.account = get_account_by_path(encoded_path)
+        self.account = get_account_by_path(encoded_path, self.mnemonic)
 
         # Message is preceeded by length in 4-byte chunk
         # message_length = struct.unpack(">I", data[path_end : path_end + 4])
@@ -157,7 +159,7 @@ class MockDongle:
         path_length = data[0] * 4
         path_end = path_length + 1
         encoded_path = data[1:path_end]
-        self.account = get_account_by_path(encoded_path)
+        self.account = get_account_by_path(encoded_path, self.mnemonic)
 
         # Push this message data onto the stack
         payload = data[path_end:]
@@ -189,6 +191,10 @@ class MockDongle:
         else:
             raise ValueError(f"Unknown command {decode_hex(cmd)}")
 
+    def close(self):
+        """Close the connection."""
+        self.opened = False
+
 
 class MockExceptionDongle(MockDongle):
     """MockDongle to cause errors."""
@@ -197,7 +203,7 @@ class MockExceptionDongle(MockDongle):
 
     def __init__(self, exception: Exception):
         """Initialize a mock dongle that raises an exception."""
-        self._reset()
+        super().__init__()
         self.exception = exception
 
     def exchange(self, apdu, timeout=20000):
@@ -209,8 +215,8 @@ class MockExceptionDongle(MockDongle):
         pass
 
 
-def _get_mock_dongle():
-    return MockDongle()
+def _get_mock_dongle(mnemonic: str = TEST_MNEMONIC):
+    return MockDongle(mnemonic)
 
 
 @pytest.fixture
@@ -218,7 +224,9 @@ def yield_dongle():
     """Yield a dongle for testing."""
 
     @contextmanager
-    def yield_yield_dongle(exception: Optional[LedgerError] = None):
+    def yield_yield_dongle(
+        exception: Optional[LedgerError] = None, mnemonic: str = TEST_MNEMONIC
+    ):
         if exception is not None:
             dongle = MockExceptionDongle(exception=exception)
             yield dongle
@@ -230,6 +238,6 @@ def yield_dongle():
             dongle.close()  # pyright: ignore
 
         else:
-            yield _get_mock_dongle()
+            yield _get_mock_dongle(mnemonic)
 
     return yield_yield_dongle
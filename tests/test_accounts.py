@@ -0,0 +1,199 @@
+"""Test account derivation and lookup"""
+
+import pytest
+from ledgerblue.commException import CommException
+
+import ledgereth.accounts
+from ledgereth.accounts import (
+    clear_account_cache,
+    find_account,
+    get_account_by_path,
+    get_accounts,
+)
+from ledgereth.constants import DEFAULT_PATH_STRING
+from ledgereth.exceptions import LedgerNotFound
+from ledgereth.messages import sign_message
+
+from .conftest import USE_REAL_DONGLE, MockDongle
+
+OTHER_MNEMONIC = (
+    "abandon abandon abandon abandon abandon abandon abandon abandon abandon"
+    " abandon abandon about"
+)
+
+
+def test_account_cache(yield_dongle):
+    """Test that derived accounts are served from cache"""
+    clear_account_cache()
+
+    with yield_dongle() as dongle:
+        account = get_account_by_path(DEFAULT_PATH_STRING, dongle)
+
+        # The device is never asked again once the account is cached
+        def _exchange(apdu, timeout=20000):
+            raise CommException("TEST", 0x6F00, 0x00)
+
+        dongle.exchange = _exchange
+
+        assert get_account_by_path(DEFAULT_PATH_STRING, dongle) == account
+
+        clear_account_cache()
+
+        with pytest.raises(LedgerNotFound):
+            get_account_by_path(DEFAULT_PATH_STRING, dongle)
+
+
+@pytest.mark.skipif(USE_REAL_DONGLE, reason="Needs two devices with different seeds")
+def test_account_cache_per_dongle(yield_dongle):
+    """Test that accounts cached for one dongle are never used for another"""
+    clear_account_cache()
+
+    with yield_dongle() as dongle, yield_dongle(mnemonic=OTHER_MNEMONIC) as other:
+        account = get_account_by_path(DEFAULT_PATH_STRING, dongle)
+        other_account = get_account_by_path(DEFAULT_PATH_STRING, other)
+
+        assert account.address != other_account.address
+        assert get_account_by_path(DEFAULT_PATH_STRING, dongle) == account
+        assert find_account(other_account.address, dongle, count=3) is None
+        assert find_account(other_account.address, other, count=3) == other_account
+
+
+@pytest.mark.skipif(USE_REAL_DONGLE, reason="Counts exchanges with a mock dongle")
+def test_account_cache_survives_signing(monkeypatch):
+    """Test that signing with the shared dongle doesn't drop its cached accounts"""
+    clear_account_cache()
+    opened = []
+    derived = []
+
+    def _get_dongle(debug=False):
+        dongle = MockDongle()
+        exchange = dongle.exchange
+
+        def _exchange(apdu, timeout=20000):
+            if apdu[:4] == b"\xe0\x02\x00\x00":
+                derived.append(apdu)
+            return exchange(apdu, timeout)
+
+        dongle.exchange = _exchange
+        opened.append(dongle)
+        return dongle
+
+    monkeypatch.setattr("ledgereth.comms.getDongle", _get_dongle)
+    monkeypatch.setattr("ledgereth.comms.DONGLE_CACHE", None)
+
+    account = find_account(get_accounts(count=2)[1].address)
+    assert account is not None
+    derived.clear()
+
+    sign_message("hi", account.path)
+
+    assert find_account(account.address) == account
+    assert len(opened) == 1
+    assert derived == []
+
+    clear_account_cache()
+
+
+def test_find_account_stops_early(yield_dongle):
+    """Test that find_account stops deriving once the account is found"""
+    clear_account_cache()
+
+    with yield_dongle() as dongle:
+        exchanges = []
+        exchange = dongle.exchange
+
+        def _exchange(apdu, timeout=20000):
+            exchanges.append(apdu)
+            return exchange(apdu, timeout)
+
+        dongle.exchange = _exchange
+        account = get_account_by_path("44'/60'/1'/0/0", dongle)
+
+        clear_account_cache()
+        exchanges.clear()
+
+        assert find_account(account.address, dongle, count=5) == account
+        assert len(exchanges) == 2
+
+
+def test_account_cache_dir(yield_dongle, monkeypatch, tmp_path):
+    """Test that derived accounts are saved for future runs"""
+    monkeypatch.setattr("ledgereth.accounts.ACCOUNT_CACHE_DIR", str(tmp_path))
+    clear_account_cache()
+
+    with yield_dongle() as dongle:
+        account = get_account_by_path("44'/60'/3'/0/0", dongle)
+
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    # A new run only needs the device to identify which saved accounts to use
+    clear_account_cache()
+
+    with yield_dongle() as dongle:
+        exchanges = []
+        exchange = dongle.exchange
+
+        def _exchange(apdu, timeout=20000):
+            exchanges.append(apdu)
+            return exchange(apdu, timeout)
+
+        dongle.exchange = _exchange
+
+        assert get_account_by_path("44'/60'/3'/0/0", dongle) == account
+        assert len(exchanges) == 1
+
+    clear_account_cache()
+
+
+@pytest.mark.parametrize(
+    "saved",
+    [
+        "not json",
+        "[1, 2, 3]",
+        '{"not a path": "0x0000000000000000000000000000000000000000"}',
+        '{"44\'/60\'/3\'/0/0": "not an address"}',
+        "{\"44'/60'/3'/0/0\": 1}",
+    ],
+)
+def test_account_cache_dir_malformed(yield_dongle, monkeypatch, tmp_path, saved):
+    """Test that a malformed saved accounts file is ignored"""
+    monkeypatch.setattr("ledgereth.accounts.ACCOUNT_CACHE_DIR", str(tmp_path))
+    clear_account_cache()
+
+    with yield_dongle() as dongle:
+        first_account = get_account_by_path(DEFAULT_PATH_STRING, dongle)
+        (tmp_path / f"{first_account.address}.json").write_text(saved)
+
+    clear_account_cache()
+
+    with yield_dongle() as dongle:
+        account = get_account_by_path("44'/60'/3'/0/0", dongle)
+
+    assert account.path == "44'/60'/3'/0/0"
+
+    clear_account_cache()
+
+
+def test_account_cache_dir_saves_once(yield_dongle, monkeypatch, tmp_path):
+    """Test that fetching several accounts saves them once"""
+    monkeypatch.setattr("ledgereth.accounts.ACCOUNT_CACHE_DIR", str(tmp_path))
+    clear_account_cache()
+
+    saves = []
+    save_accounts = ledgereth.accounts._save_accounts
+
+    def _save_accounts(accounts):
+        saves.append(len(accounts))
+        save_accounts(accounts)
+
+    monkeypatch.setattr("ledgereth.accounts._save_accounts", _save_accounts)
+
+    with yield_dongle() as dongle:
+        assert len(get_accounts(dongle, count=5)) == 5
+        assert saves == [5]
+
+        # Nothing new to save
+        get_accounts(dongle, count=5)
+        assert saves == [5]
+
+    clear_account_cache()
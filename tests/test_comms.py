@@ -17,26 +17,31 @@ import rlp
 from eth_utils.hexadecimal import decode_hex, encode_hex
 
 from ledgereth.comms import (
+    LedgerCommands,
+    close_dongle,
     decode_response_address,
     decode_response_version_from_config,
     dongle_send,
     dongle_send_data,
     init_dongle,
+    is_usable_version,
 )
 from ledgereth.constants import (
     DATA_CHUNK_SIZE,
     DEFAULT_PATH_ENCODED,
 )
-from ledgereth.objects import SignedTransaction, Transaction
+from ledgereth.objects import ISO7816Command, SignedTransaction, Transaction
 from ledgereth.utils import chunks, parse_bip32_path
 
+from .conftest import MockDongle
+
 GET_CONFIGURATION = "GET_CONFIGURATION"
 GET_DEFAULT_ADDRESS_NO_CONFIRM = "GET_DEFAULT_ADDRESS_NO_CONFIRM"
 GET_ADDRESS_NO_CONFIRM = "GET_ADDRESS_NO_CONFIRM"
 SIGN_TX_FIRST_DATA = "SIGN_TX_FIRST_DATA"
 
 
-@pytest.mark.parametrize("data_size", [32, 255, 512, 5000])
+@pytest.mark.parametrize("data_size", [32, 255, 510, 512, 5000])
 def test_chunks(data_size):
     chunk_size = 255
     data = os.urandom(data_size)
@@ -53,6 +58,69 @@ def test_chunks(data_size):
     assert b"".join(parts) == data
 
 
+def test_commands_with_data():
+    data = b"\x01\x02\x03"
+    command = LedgerCommands.GET_ADDRESS_NO_CONFIRM
+
+    assert LedgerCommands.get_with_data("GET_ADDRESS_NO_CONFIRM", data) == (
+        b"\xe0\x02\x00\x00\x03" + data
+    )
+    # The shared command isn't modified by encoding it with data
+    assert command.data is None
+    assert LedgerCommands.get("GET_ADDRESS_NO_CONFIRM") == command.encode()
+
+    with pytest.raises(ValueError):
+        LedgerCommands.get("NOT_A_COMMAND")
+
+
+def test_commands_changed(monkeypatch):
+    command = ISO7816Command(b"\xe0", b"\x02", b"\x00", b"\x00")
+    monkeypatch.setitem(LedgerCommands._COMMANDS, "TEST_COMMAND", command)
+
+    assert LedgerCommands.get("TEST_COMMAND") == b"\xe0\x02\x00\x00\x00"
+
+    # A changed command is encoded again, rather than served stale
+    command.set_data(b"\x01\x02")
+    assert LedgerCommands.get("TEST_COMMAND") == b"\xe0\x02\x00\x00\x02\x01\x02"
+
+    command.Lc = b"\x05"
+    command.Le = b"\x20"
+    assert LedgerCommands.get("TEST_COMMAND") == b"\xe0\x02\x00\x00\x05\x01\x02\x20"
+
+
+def test_command_lc():
+    data = b"\x01\x02\x03"
+
+    assert ISO7816Command(b"\xe0", b"\x02", b"\x00", b"\x00").encode() == (
+        b"\xe0\x02\x00\x00\x00"
+    )
+    assert ISO7816Command(b"\xe0", b"\x02", b"\x00", b"\x00", data=data).encode() == (
+        b"\xe0\x02\x00\x00\x03" + data
+    )
+    # An explicit Lc is kept, even with data
+    assert ISO7816Command(
+        b"\xe0", b"\x02", b"\x00", b"\x00", Lc=b"\x05", data=data
+    ).encode() == (b"\xe0\x02\x00\x00\x05" + data)
+
+    # Too much data is rejected the same way as by encode_with_data()
+    with pytest.raises(ValueError):
+        ISO7816Command(b"\xe0", b"\x02", b"\x00", b"\x00", data=b"\x00" * 256)
+
+
+@pytest.mark.parametrize(
+    "version,usable",
+    [
+        ((1, 2, 3), False),
+        ((1, 2, 4), True),
+        ((1, 10, 0), True),
+        ((2, 0, 0), False),
+        ((9, 9, 9), True),
+    ],
+)
+def test_is_usable_version(version, usable):
+    assert is_usable_version(bytes((0, *version))) is usable
+
+
 def test_comms_init_dongle_patched(monkeypatch, yield_dongle):
     with yield_dongle() as dongle:
 
@@ -66,6 +134,55 @@ def test_comms_init_dongle_patched(monkeypatch, yield_dongle):
         assert dong == dongle
 
 
+def test_comms_init_dongle_cached(monkeypatch):
+    monkeypatch.setattr("ledgereth.comms.getDongle", lambda debug=False: MockDongle())
+    monkeypatch.setattr("ledgereth.comms.DONGLE_CACHE", None)
+
+    dongle = init_dongle()
+    assert init_dongle() is dongle
+
+    # A cached dongle that was closed elsewhere is replaced
+    dongle.opened = False  # pyright: ignore
+    reopened = init_dongle()
+    assert reopened is not dongle
+
+    close_dongle()
+    assert init_dongle() is not reopened
+
+
+def test_comms_init_dongle_reopen_config(monkeypatch):
+    configs = []
+
+    def _get_dongle(debug=False):
+        dongle = MockDongle()
+        handle_get_configuration = dongle._handle_get_configuration
+
+        def _handle(lc, data):
+            configs.append(dongle)
+            return handle_get_configuration(lc, data)
+
+        dongle._handle_get_configuration = _handle
+        return dongle
+
+    monkeypatch.setattr("ledgereth.comms.getDongle", _get_dongle)
+    monkeypatch.setattr("ledgereth.comms.DONGLE_CACHE", None)
+    monkeypatch.setattr("ledgereth.comms.DONGLE_CONFIG_CACHE", None)
+
+    dongle = init_dongle()
+    assert init_dongle() is dongle
+    assert configs == [dongle]
+
+    # Whatever device is opened next gets its firmware version checked again
+    close_dongle()
+    reopened = init_dongle()
+    assert configs == [dongle, reopened]
+
+    reopened.close()
+    assert configs == [dongle, reopened, init_dongle()]
+
+    close_dongle()
+
+
 def test_comms_init_dongle_mockdongle(yield_dongle):
     with yield_dongle() as dongle:
         dong = init_dongle(dongle)
@@ -86,3 +86,11 @@ def test_comms_unknown_error(yield_dongle):
             dongle_send(dongle, "SIGN_TX_FIRST_DATA")
 
         assert "UNKNOWN" in str(err.value)
+
+
+def test_comms_unmapped_error(yield_dongle):
+    with yield_dongle(exception=CommException("TEST", 0x6700, 0x00)) as dongle:
+        with pytest.raises(LedgerError) as err:
+            dongle_send(dongle, "SIGN_TX_FIRST_DATA")
+
+        assert "0x6700 INCORRECT_LENGTH" in str(err.value)
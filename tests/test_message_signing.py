@@ -2,12 +2,16 @@
 Test higher level message signing functionality
 """
 
+import pytest
 from eth_account import Account
 from eth_account.messages import encode_defunct, encode_typed_data
+from ledgerblue.commException import CommException
 
 from ledgereth.accounts import get_accounts
+from ledgereth.exceptions import LedgerCancel
 from ledgereth.messages import sign_message, sign_typed_data_draft
 
+from .conftest import MockExceptionDongle
 from .fixtures import eip712_dict, large_message
 
 
@@ -72,3 +76,17 @@ def test_sign_typed_data(yield_dongle):
 
         vrs = (signed.v, signed.r, signed.s)
         assert sender == Account.recover_message(signable, vrs)
+
+
+def test_sign_message_keeps_shared_dongle_open(monkeypatch):
+    """Test that the shared dongle is left open, even if signing fails"""
+    dongle = MockExceptionDongle(exception=CommException("TEST", 0x6985, 0x00))
+    closed = []
+    dongle.close = lambda: closed.append(True)
+    monkeypatch.setattr("ledgereth.messages.init_dongle", lambda _: dongle)
+
+    with pytest.raises(LedgerCancel):
+        sign_message("test")
+
+    # The shared dongle is closed by close_dongle(), at exit at the latest
+    assert closed == []
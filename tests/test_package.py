@@ -0,0 +1,30 @@
+"""Test the ledgereth package's lazily imported attributes"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "attribute",
+    ["objects", "accounts", "comms", "utils", "Transaction", "sign_message"],
+)
+def test_lazy_attributes(attribute):
+    """Test that submodules and the public API are reachable from the package"""
+    # A fresh interpreter, so nothing has already been imported by other tests
+    result = subprocess.run(
+        [sys.executable, "-c", f"import ledgereth; ledgereth.{attribute}"],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_unknown_attribute():
+    """Test that unknown attributes still raise AttributeError"""
+    import ledgereth
+
+    with pytest.raises(AttributeError):
+        ledgereth.not_a_submodule
@@ -2,12 +2,14 @@
 Test objects and serialization
 """
 
+import pytest
 from eth_utils.address import is_checksum_address
 from eth_utils.hexadecimal import decode_hex
 
 from ledgereth.constants import DEFAULT_CHAIN_ID, DEFAULTS
 from ledgereth.objects import (
     LedgerAccount,
+    SignedMessage,
     SignedTransaction,
     SignedType1Transaction,
     SignedType2Transaction,
@@ -106,6 +108,8 @@ def test_signed_legacy_serialization(yield_dongle):
     assert tx.s == s
     assert tx.v == v
     assert tx.raw_transaction()
+    assert SignedTransaction.from_rawtx(decode_hex(tx.raw_transaction())) == tx
+    assert tx.rawTransactionBytes == decode_hex(tx.rawTransaction)
 
 
 def test_type1_serialization(yield_dongle):
@@ -195,6 +199,7 @@ def test_signed_type1_serialization(yield_dongle):
     assert tx.access_list[0][0] == destination
     assert len(tx.access_list[0][1]) == len(access_list[0][1])
     assert tx.raw_transaction()
+    assert tx.rawTransactionBytes == decode_hex(tx.rawTransaction)
 
 
 def test_type2_serialization(yield_dongle):
@@ -290,3 +295,33 @@ def test_signed_type2_serialization(yield_dongle):
     assert tx.access_list[0][0] == destination
     assert len(tx.access_list[0][1]) == len(access_list[0][1])
     assert tx.raw_transaction()
+    assert tx.rawTransactionBytes == decode_hex(tx.rawTransaction)
+
+
+def test_signed_message_signature():
+    """Test the encoded signature of a signed message"""
+    signed = SignedMessage(b"test", 0, 1, 2)
+
+    # Zero is a valid v
+    assert signed.signature == "0x" + "00" * 31 + "01" + "00" * 31 + "02" + "00"
+
+    with pytest.raises(ValueError):
+        SignedMessage(b"test", None, 1, 2).signature
+
+
+def test_transaction_mapping():
+    """Test the read-only mapping and dict of a transaction"""
+    tx = Transaction(1, int(1e9), int(1e6), b"", 0, b"")
+    mapping = tx.as_mapping()
+
+    assert mapping["nonce"] == 1
+    assert mapping == tx.to_dict()
+
+    with pytest.raises(TypeError):
+        mapping["nonce"] = 2  # type: ignore
+
+    # to_dict() returns a copy that can be modified freely
+    d = tx.to_dict()
+    d["nonce"] = 2
+
+    assert tx.as_mapping()["nonce"] == 1
@@ -2,12 +2,23 @@
 Test higher level transaction functionality
 """
 
+import pytest
+import rlp
 from eth_account import Account
 from eth_utils.hexadecimal import decode_hex
 
 from ledgereth.accounts import get_accounts
-from ledgereth.objects import Transaction
-from ledgereth.transactions import create_transaction, sign_transaction
+from ledgereth.objects import (
+    SignedType2Transaction,
+    Transaction,
+    TransactionType,
+    Type2Transaction,
+)
+from ledgereth.transactions import (
+    create_transaction,
+    decode_transaction,
+    sign_transaction,
+)
 
 
 def test_pre_155_send(yield_dongle):
@@ -201,3 +212,28 @@ def test_contract_deploy_legacy(yield_dongle):
         assert signed.r
         assert signed.s
         assert sender == Account.recover_transaction(signed.rawTransaction)
+
+
+def test_decode_transaction():
+    destination = b"\x01" * 20
+    tx = Type2Transaction(1, 0, int(1e9), int(1e10), 21000, destination, 1, b"")
+    signed = SignedType2Transaction(
+        1, 0, int(1e9), int(1e10), 21000, destination, 1, b"", [], 1, 2, 3
+    )
+    payload = bytes(rlp.encode(tx))
+
+    assert decode_transaction(TransactionType.EIP_1559.to_byte() + payload) == tx
+    assert (
+        decode_transaction(decode_hex(signed.raw_transaction()), signed=True) == signed
+    )
+
+    with pytest.raises(NotImplementedError):
+        decode_transaction(b"\x05" + payload)
+
+    with pytest.raises(ValueError):
+        Transaction.from_rawtx(b"\x7f" + payload)
+
+    # RLP string prefixes are neither typed nor legacy transactions
+    for prefix in (b"\x80", b"\xbf"):
+        with pytest.raises(ValueError, match="not a valid raw transaction"):
+            decode_transaction(prefix + payload)
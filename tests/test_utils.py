@@ -1,6 +1,14 @@
-from ledgereth.constants import DEFAULT_PATH_ENCODED, DEFAULT_PATH_STRING
+from ledgereth.constants import (
+    DEFAULT_PATH_ENCODED,
+    DEFAULT_PATH_STRING,
+    LEGACY_PATH_ENCODED,
+    LEGACY_PATH_STRING,
+    getenvint,
+)
 from ledgereth.utils import (
+    checksum_address,
     decode_bip32_path,
+    encode_bip32_path,
     is_bip32_path,
     is_bytes,
     is_hex_string,
@@ -8,6 +16,26 @@ from ledgereth.utils import (
 )
 
 
+def test_getenvint(monkeypatch):
+    """Test getenvint() reads the given env var"""
+    monkeypatch.setenv("LEDGERETH_TEST_INT", "7")
+    monkeypatch.setenv("MAX_ACCOUNTS_FETCH", "9")
+    assert getenvint("LEDGERETH_TEST_INT") == 7
+
+    monkeypatch.setenv("LEDGERETH_TEST_INT", "seven")
+    assert getenvint("LEDGERETH_TEST_INT", 3) == 3
+
+    monkeypatch.delenv("LEDGERETH_TEST_INT")
+    assert getenvint("LEDGERETH_TEST_INT", 3) == 3
+
+
+def test_checksum_address():
+    """Test checksum_address() against a known EIP-55 address"""
+    address = "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed"
+    assert checksum_address(address.lower()) == address
+    assert checksum_address(address) == address
+
+
 def test_is_bytes():
     """Test is_bytes()"""
     assert is_bytes(b"0xdeadbeef")
@@ -29,3 +57,20 @@ def test_path_encoding():
     assert encoded == DEFAULT_PATH_ENCODED
     decoded = decode_bip32_path(encoded)
     assert decoded == DEFAULT_PATH_STRING
+
+
+def test_path_encoding_legacy():
+    """Test encode/decode of legacy Ledger BIP-32 paths"""
+    assert parse_bip32_path(LEGACY_PATH_STRING) == LEGACY_PATH_ENCODED
+
+    path = "44'/60'/0'/7"
+    encoded = parse_bip32_path(path)
+    assert encoded == b"\x80\x00\x00,\x80\x00\x00<\x80\x00\x00\x00\x00\x00\x00\x07"
+    assert decode_bip32_path(encoded) == path
+
+
+def test_encode_bip32_path():
+    """Test that encoded paths are prefixed with their depth"""
+    encoded = encode_bip32_path(DEFAULT_PATH_STRING)
+    assert encoded[0] == DEFAULT_PATH_STRING.count("/") + 1
+    assert encoded[1:] == DEFAULT_PATH_ENCODED